@@ -18,6 +18,7 @@ from .const import (
     CONF_USERNAME,
     CONF_REGION,
     CONF_APP_ID,
+    DATA_PENDING,
     DOMAIN,
 )
 
@@ -48,22 +49,33 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if not app_id:
         raise ConfigEntryNotReady
     
-    session = async_get_clientsession(hass)
-
-    # Create a device manager and login
-    device_manager = DeviceManager(session, app_id, region)
-
-    try:
-        await device_manager.login(username, password)
-    except Exception as ex:  # pylint: disable=broad-except
-        _LOGGER.error("Failed to login: %s", ex)
-        raise ConfigEntryNotReady from ex
+    # Reuse the device manager the config flow has just logged in with
+    device_manager = hass.data.get(DATA_PENDING, {}).pop(username, None)
+    if device_manager is None:
+        # Reuse Home Assistant's shared session so the connection pool stays warm
+        session = async_get_clientsession(hass)
+
+        # Create a device manager and login
+        device_manager = DeviceManager(session, app_id, region)
+
+        try:
+            await device_manager.login(username, password)
+        except Exception as ex:  # pylint: disable=broad-except
+            _LOGGER.error("Failed to login: %s", ex)
+            await device_manager.close()
+            raise ConfigEntryNotReady from ex
 
     coordinator = VestaCoordinator(hass, device_manager)
-    await coordinator.async_config_entry_first_refresh()
-
-    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
-    await hass.config_entries.async_forward_entry_setups(entry, _PLATFORMS)
+    try:
+        await coordinator.async_config_entry_first_refresh()
+        hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
+        await hass.config_entries.async_forward_entry_setups(entry, _PLATFORMS)
+    except BaseException:
+        # The entry will not be unloaded, so stop the token refresh and sockets here
+        hass.data.get(DOMAIN, {}).pop(entry.entry_id, None)
+        await coordinator.async_shutdown()
+        await device_manager.close()
+        raise
 
     entry.async_on_unload(entry.add_update_listener(async_reload_entry))
     return True
@@ -75,7 +87,11 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         entry, _PLATFORMS
     )
     if unload_ok:
+        coordinator: VestaCoordinator = hass.data[DOMAIN][entry.entry_id]
+        await coordinator.async_shutdown()
         hass.data[DOMAIN].pop(entry.entry_id)
+        # The session is shared by Home Assistant, so only our sockets are closed
+        await coordinator.device_manager.close()
 
     return unload_ok
 
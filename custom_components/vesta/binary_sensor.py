@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-from collections.abc import Mapping
-
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from operator import attrgetter
 from typing import Any
 
 from homeassistant.components.binary_sensor import (
@@ -10,175 +11,102 @@ from homeassistant.components.binary_sensor import (
     BinarySensorEntityDescription,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import VestaCoordinator
 from .const import DOMAIN
+from .coordinator import VestaState
 from .entity import VestaEntity
 from .pygizwits import GizwitsDevice
 
 
+@dataclass(frozen=True, kw_only=True)
+class VestaBinarySensorEntityDescription(BinarySensorEntityDescription):
+    """Describes a Vesta binary sensor and how to read it from the device state."""
+
+    value_fn: Callable[[VestaState], bool | None]
+    attributes_fn: Callable[[VestaState], Mapping[str, Any] | None] | None = None
+    always_available: bool = False
+
+
+_BINARY_SENSORS: tuple[VestaBinarySensorEntityDescription, ...] = (
+    # The connectivity sensor stays available to report the device going offline
+    VestaBinarySensorEntityDescription(
+        key="connected",
+        device_class=BinarySensorDeviceClass.CONNECTIVITY,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        name="Connected",
+        value_fn=attrgetter("is_online"),
+        always_available=True,
+    ),
+    VestaBinarySensorEntityDescription(
+        key="_has_error",
+        name="Errors",
+        device_class=BinarySensorDeviceClass.PROBLEM,
+        value_fn=attrgetter("has_error"),
+        attributes_fn=attrgetter("error_attributes"),
+    ),
+    VestaBinarySensorEntityDescription(
+        key="res2",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        name="Res2",
+        value_fn=attrgetter("res2"),
+    ),
+    # Word hour 100 ????
+    VestaBinarySensorEntityDescription(
+        key="word_hour",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        name="Word hour 100?",
+        value_fn=attrgetter("word_hour100"),
+    ),
+    VestaBinarySensorEntityDescription(
+        key="water_temp_reached",
+        device_class=BinarySensorDeviceClass.HEAT,
+        name="Water temperature reached",
+        value_fn=attrgetter("water_hated"),
+    ),
+)
+
+
 async def async_setup_entry(
         hass: HomeAssistant,
         config_entry: ConfigEntry,
         async_add_entities: AddEntitiesCallback,
 ) -> None:
     coordinator: VestaCoordinator = hass.data[DOMAIN][config_entry.entry_id]
-    entities: list[VestaEntity] = []
-
-    for device in coordinator.device_manager.devices.values():
-        entities.extend(
-            [
-                VestaConnectivitySensor(coordinator, config_entry, device),
-                VestaErrorsSensor(coordinator, config_entry, device),
-                VestaRes2Sensor(coordinator, config_entry, device),
-                VestaWordHourSensor(coordinator, config_entry, device),
-                VestaWaterReachedTemperatureSensor(coordinator, config_entry, device),
-            ]
-        )
-
-    async_add_entities(entities)
 
+    async_add_entities(
+        VestaBinarySensor(coordinator, config_entry, device, description)
+        for device in coordinator.device_manager.devices.values()
+        for description in _BINARY_SENSORS
+    )
 
-class VestaConnectivitySensor(VestaEntity, BinarySensorEntity):
-    """Sensor to indicate whether a device is currently online."""
-
-    def __init__(
-            self,
-            coordinator: VestaCoordinator,
-            config_entry: ConfigEntry,
-            device: GizwitsDevice
-    ) -> None:
-        """Initialize sensor."""
-        super().__init__(coordinator, config_entry, device, BinarySensorEntityDescription(
-            key="connected",
-            device_class=BinarySensorDeviceClass.CONNECTIVITY,
-            entity_category=EntityCategory.DIAGNOSTIC,
-            name="Connected",
-        ))
-
-    @property
-    def is_on(self) -> bool | None:
-        """Return True if online."""
-        return self.vesta_device is not None and self.vesta_device.is_online
-
-    @property
-    def available(self) -> bool:
-        """Return True, as the connectivity sensor is always available."""
-        return True
-
-
-class VestaRes2Sensor(VestaEntity, BinarySensorEntity):
-    """Sensor for res2."""
-
-    def __init__(
-            self,
-            coordinator: VestaCoordinator,
-            config_entry: ConfigEntry,
-            device: GizwitsDevice
-    ) -> None:
-        """Initialize sensor."""
-        super().__init__(coordinator, config_entry, device, BinarySensorEntityDescription(
-            key="res2",
-            entity_category=EntityCategory.DIAGNOSTIC,
-            name="Res2",
-        ))
-
-    @property
-    def is_on(self) -> bool | None:
-        return self.vesta_device is not None and self.vesta_device.attributes.get("res2")
-
-
-class VestaWordHourSensor(VestaEntity, BinarySensorEntity):
-    """Sensor for word hour 100 ????."""
-
-    def __init__(
-            self,
-            coordinator: VestaCoordinator,
-            config_entry: ConfigEntry,
-            device: GizwitsDevice
-    ) -> None:
-        """Initialize sensor."""
-        super().__init__(coordinator, config_entry, device, BinarySensorEntityDescription(
-            key="word_hour",
-            entity_category=EntityCategory.DIAGNOSTIC,
-            name="Word hour 100?",
-        ))
-
-    @property
-    def is_on(self) -> bool | None:
-        return self.vesta_device is not None and self.vesta_device.attributes.get("word_hour100")
-
-
-class VestaWaterReachedTemperatureSensor(VestaEntity, BinarySensorEntity):
-    """Sensor for water reached temperature."""
-
-    def __init__(
-            self,
-            coordinator: VestaCoordinator,
-            config_entry: ConfigEntry,
-            device: GizwitsDevice
-    ) -> None:
-        """Initialize sensor."""
-        super().__init__(coordinator, config_entry, device, BinarySensorEntityDescription(
-            key="water_temp_reached",
-            device_class=BinarySensorDeviceClass.HEAT,
-            name="Water temperature reached",
-        ))
-
-    @property
-    def is_on(self) -> bool | None:
-        return self.vesta_device is not None and self.vesta_device.attributes.get("water_hated")
 
+class VestaBinarySensor(VestaEntity, BinarySensorEntity):
+    """Binary sensor reading a single value from the device state."""
 
-class VestaErrorsSensor(VestaEntity, BinarySensorEntity):
-    """Sensor to indicate an error state."""
+    entity_description: VestaBinarySensorEntityDescription
 
     def __init__(
             self,
             coordinator: VestaCoordinator,
             config_entry: ConfigEntry,
-            device: GizwitsDevice
+            device: GizwitsDevice,
+            description: VestaBinarySensorEntityDescription,
     ) -> None:
         """Initialize sensor."""
-        super().__init__(coordinator, config_entry, device, BinarySensorEntityDescription(
-            key="_has_error",
-            name="Errors",
-            device_class=BinarySensorDeviceClass.PROBLEM,
-        ))
-
-    @property
-    def is_on(self) -> bool | None:
-        """Return true if reporting an error."""
-        if not self.status:
-            return None
-
-        errors = []
-        for err_num in range(0, 1):
-            if self.device.attributes.get("error_code")[err_num] != 0:
-                errors.append(err_num)
-
-        return (len(errors) > 0 or
-                self.device.attributes.get("low_water_level") or
-                self.device.attributes.get("not_working_properly") or
-                self.device.attributes.get("loss_power") or
-                self.device.attributes.get("no_water") or
-                self.device.attributes.get("work_alert"))
-
-    @property
-    def extra_state_attributes(self) -> Mapping[str, Any] | None:
-        """Return more detailed error information."""
-        if not self.status:
-            return None
-
-        return {
-            "e00": self.device.attributes.get("error_code")[0],
-            "e01": self.device.attributes.get("error_code")[1],
-            "low_water_level": self.device.attributes.get("low_water_level"),
-            "not_working_properly": self.device.attributes.get("not_working_properly"),
-            "loss_power": self.device.attributes.get("loss_power"),
-            "no_water": self.device.attributes.get("no_water"),
-            "work_alert": self.device.attributes.get("work_alert"),
-        }
+        super().__init__(coordinator, config_entry, device, description)
+
+    @callback
+    def _async_update_attrs(self) -> None:
+        """Update the sensor from the device state."""
+        super()._async_update_attrs()
+        description = self.entity_description
+        state = self.vesta_state
+        if description.always_available:
+            self._attr_available = True
+        self._attr_is_on = description.value_fn(state)
+        if description.attributes_fn is not None:
+            self._attr_extra_state_attributes = description.attributes_fn(state)
@@ -18,15 +18,10 @@ async def async_setup_entry(
 ) -> None:
     coordinator: VestaCoordinator = hass.data[DOMAIN][config_entry.entry_id]
 
-    entities: list[VestaEntity] = []
-
-    for device in coordinator.device_manager.devices.values():
-        entities.extend(
-            [
-                VestaStartTimerButton(coordinator, config_entry, device),
-            ]
-        )
-    async_add_entities(entities)
+    async_add_entities(
+        VestaStartTimerButton(coordinator, config_entry, device)
+        for device in coordinator.device_manager.devices.values()
+    )
 
 
 class VestaStartTimerButton(VestaEntity, ButtonEntity):
@@ -45,4 +40,4 @@ class VestaStartTimerButton(VestaEntity, ButtonEntity):
         ))
 
     async def async_press(self) -> None:
-        await self.device.set_device_attribute("res1", 0)
+        await self.async_set_device_attributes({"res1": 0})
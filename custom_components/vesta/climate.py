@@ -6,7 +6,7 @@ from homeassistant.components.climate import ClimateEntity, ClimateEntityFeature
 from homeassistant.components.climate.const import ATTR_HVAC_MODE, HVACAction, HVACMode
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import ATTR_TEMPERATURE, UnitOfTemperature, PRECISION_TENTHS
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import VestaCoordinator
@@ -18,6 +18,8 @@ _MIN_TEMP_C = 5
 _MIN_TEMP_F = 41
 _MAX_TEMP_C = 95
 _MAX_TEMP_F = 203
+_UNIT_C = str(UnitOfTemperature.CELSIUS)
+_UNIT_F = str(UnitOfTemperature.FAHRENHEIT)
 
 
 async def async_setup_entry(
@@ -27,15 +29,10 @@ async def async_setup_entry(
 ) -> None:
     coordinator: VestaCoordinator = hass.data[DOMAIN][config_entry.entry_id]
 
-    entities: list[VestaEntity] = []
-
-    for device in coordinator.device_manager.devices.values():
-        entities.extend(
-            [
-                VestaClimate(coordinator, config_entry, device),
-            ]
-        )
-    async_add_entities(entities)
+    async_add_entities(
+        VestaClimate(coordinator, config_entry, device)
+        for device in coordinator.device_manager.devices.values()
+    )
 
 
 class VestaClimate(VestaEntity, ClimateEntity):
@@ -61,77 +58,40 @@ class VestaClimate(VestaEntity, ClimateEntity):
             icon="mdi:thermometer"
         ))
 
-    @property
-    def hvac_mode(self) -> HVACMode | str | None:
-        """Return the current mode (HEAT or OFF)."""
-        if not self.status:
-            return None
-        return HVACMode.HEAT if self.device.attributes["onoff"] else HVACMode.OFF
-
-    @property
-    def hvac_action(self) -> HVACAction | str | None:
-        """Return the current running action (HEATING or IDLE)."""
-        if not self.status:
-            return None
-        heat_on = self.device.attributes["onoff"]
-        target_reached = self.device.attributes["water_hated"]
-        return (
-            HVACAction.HEATING if (heat_on and not target_reached) else HVACAction.IDLE
-        )
+    @callback
+    def _async_update_attrs(self) -> None:
+        """Update the heating state and temperatures."""
+        super()._async_update_attrs()
+        state = self.vesta_state
+        unit = _UNIT_C if not self.status or state.temp_unit == 0 else _UNIT_F
+        self._attr_temperature_unit = unit
 
-    @property
-    def current_temperature(self) -> float | None:
-        """Return the current temperature."""
-        if not self.status:
-            return None
-        return self.device.attributes["real_temp_integer"] + self.device.attributes["real_temp_decimal"] / 10.0
+        # As the cooker can be switched between temperature units, the limits are dynamic.
+        self._attr_min_temp = _MIN_TEMP_C if unit is _UNIT_C else _MIN_TEMP_F
+        self._attr_max_temp = _MAX_TEMP_C if unit is _UNIT_C else _MAX_TEMP_F
 
-    @property
-    def target_temperature(self) -> float | None:
-        """Return the temperature we try to reach."""
         if not self.status:
-            return None
-        return self.device.attributes["set_temp_integer"] + self.device.attributes["set_temp_decimal"] / 10.0
-
-    @property
-    def temperature_unit(self) -> str:
-        """Return the unit of measurement used by the platform."""
-        if not self.status or self.device.attributes["temp_unit"] == 0:
-            return str(UnitOfTemperature.CELSIUS)
-        else:
-            return str(UnitOfTemperature.FAHRENHEIT)
-
-    @property
-    def min_temp(self) -> float:
-        """
-        Get the minimum temperature that a user can set.
-
-        As the cooker can be switched between temperature units, this needs to be dynamic.
-        """
-        return (
-            _MIN_TEMP_C
-            if self.temperature_unit == UnitOfTemperature.CELSIUS
-            else _MIN_TEMP_F
-        )
+            self._attr_hvac_mode = None
+            self._attr_hvac_action = None
+            self._attr_current_temperature = None
+            self._attr_target_temperature = None
+            return
 
-    @property
-    def max_temp(self) -> float:
-        """
-        Get the maximum temperature that a user can set.
-
-        As the cooker can be switched between temperature units, this needs to be dynamic.
-        """
-        return (
-            _MAX_TEMP_C
-            if self.temperature_unit == UnitOfTemperature.CELSIUS
-            else _MAX_TEMP_F
+        heat_on = state.onoff
+        target_reached = state.water_hated
+        self._attr_hvac_mode = HVACMode.HEAT if heat_on else HVACMode.OFF
+        self._attr_hvac_action = (
+            HVACAction.HEATING if (heat_on and not target_reached) else HVACAction.IDLE
         )
+        self._attr_current_temperature = state.real_temp
+        self._attr_target_temperature = state.set_temp
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set new target hvac mode."""
         should_heat = hvac_mode == HVACMode.HEAT
-        await self.device.set_device_attribute("onoff", should_heat)
-        await self.coordinator.async_refresh()
+        attributes = {"onoff": should_heat}
+        if await self.async_set_device_attributes(attributes):
+            self._async_apply_optimistic(attributes)
 
     async def async_set_temperature(self, **kwargs: Any) -> None:
         """Set a new target temperature."""
@@ -139,12 +99,11 @@ class VestaClimate(VestaEntity, ClimateEntity):
         if target_temperature is None:
             return
 
-        if hvac_mode := kwargs.get(ATTR_HVAC_MODE):
-            should_heat = hvac_mode == HVACMode.HEAT
-            await self.deviceset_device_attributes("onoff", should_heat)
-
         temp_int = int(target_temperature)
         temp_decimal = int((target_temperature - temp_int)*10)
-        await self.device.set_device_attributes({"set_temp_integer": temp_int, "set_temp_decimal": temp_decimal})
-
-        await self.coordinator.async_refresh()
+        attributes: dict[str, Any] = {"set_temp_integer": temp_int, "set_temp_decimal": temp_decimal}
+        # Send the mode with the temperature so a single request is made
+        if hvac_mode := kwargs.get(ATTR_HVAC_MODE):
+            attributes["onoff"] = hvac_mode == HVACMode.HEAT
+        if await self.async_set_device_attributes(attributes):
+            self._async_apply_optimistic(attributes)
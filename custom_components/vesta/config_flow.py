@@ -26,6 +26,7 @@ from .const import (
     CONF_APP_ID,
     CONF_PASSWORD,
     CONF_USERNAME,
+    DATA_PENDING,
     DOMAIN,
 )
 
@@ -64,6 +65,12 @@ async def validate_input(hass: HomeAssistant, user_input: dict[str, Any]) -> dic
 
     await device_manager.login(username, password)
 
+    # Keep the logged in manager so the entry setup does not need to login again
+    pending = hass.data.setdefault(DATA_PENDING, {})
+    if previous := pending.pop(username, None):
+        await previous.close()
+    pending[username] = device_manager
+
     return {"title": username}
 
 
@@ -5,3 +5,6 @@ CONF_USERNAME = "username"
 CONF_PASSWORD = "password"
 CONF_REGION = "region"
 CONF_APP_ID = "appid"
+# Device managers logged in by the config flow, waiting to be used by the setup.
+# Kept apart from hass.data[DOMAIN], which only holds the entry coordinators.
+DATA_PENDING = f"{DOMAIN}_pending"
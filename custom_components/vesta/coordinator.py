@@ -1,18 +1,104 @@
 """Data update coordinator for the Vesta API."""
 
+from __future__ import annotations
+
 import asyncio
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import partial
 from logging import getLogger
+from typing import Any
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
+from .const import DOMAIN
 from .pygizwits import DeviceManager, GizwitsDevice
 
 _LOGGER = getLogger(__name__)
+_STATUS_UPDATE_COOLDOWN = 0.25
+_EVENT_STATUS_UPDATE = "device_status_update"
+
+
+def _temperature(attributes: dict[str, Any], prefix: str) -> float | None:
+    """Combine the integer and decimal parts of a temperature attribute."""
+    integer = attributes.get(f"{prefix}_integer")
+    decimal = attributes.get(f"{prefix}_decimal")
+    if integer is None or decimal is None:
+        return None
+    return integer + decimal / 10.0
+
+
+@dataclass(slots=True)
+class VestaState:
+    """Typed snapshot of the attributes reported by a Vesta device."""
+
+    is_online: bool
+    onoff: bool | None = None
+    water_hated: bool | None = None
+    real_temp: float | None = None
+    set_temp: float | None = None
+    temp_unit: int | None = None
+    error_code: list[int] | None = None
+    low_water_level: bool | None = None
+    not_working_properly: bool | None = None
+    loss_power: bool | None = None
+    no_water: bool | None = None
+    work_alert: bool | None = None
+    res1: bool | None = None
+    res2: bool | None = None
+    word_hour100: bool | None = None
+    # Aggregated once so the error sensor only reads two fields
+    has_error: bool | None = None
+    error_attributes: dict[str, Any] | None = None
+
+    @classmethod
+    def from_device(cls, device: GizwitsDevice) -> VestaState:
+        """Parse the raw attributes of the device."""
+        attributes = device.attributes
+        state = cls(
+            is_online=device.is_online,
+            onoff=attributes.get("onoff"),
+            water_hated=attributes.get("water_hated"),
+            real_temp=_temperature(attributes, "real_temp"),
+            set_temp=_temperature(attributes, "set_temp"),
+            temp_unit=attributes.get("temp_unit"),
+            error_code=attributes.get("error_code"),
+            low_water_level=attributes.get("low_water_level"),
+            not_working_properly=attributes.get("not_working_properly"),
+            loss_power=attributes.get("loss_power"),
+            no_water=attributes.get("no_water"),
+            work_alert=attributes.get("work_alert"),
+            res1=attributes.get("res1"),
+            res2=attributes.get("res2"),
+            word_hour100=attributes.get("word_hour100"),
+        )
+        error_code = state.error_code
+        if state.is_online and error_code is not None:
+            state.has_error = bool(
+                error_code[0] != 0
+                or state.low_water_level
+                or state.not_working_properly
+                or state.loss_power
+                or state.no_water
+                or state.work_alert
+            )
+            state.error_attributes = {
+                "e00": error_code[0],
+                "e01": error_code[1],
+                "low_water_level": state.low_water_level,
+                "not_working_properly": state.not_working_properly,
+                "loss_power": state.loss_power,
+                "no_water": state.no_water,
+                "work_alert": state.work_alert,
+            }
+        return state
 
 
 class VestaCoordinator(DataUpdateCoordinator[dict[str, GizwitsDevice]]):
-    """Update coordinator that polls the device status for all devices in an account."""
+    """Update coordinator that receives the device status pushed over the websocket."""
 
     def __init__(self, hass: HomeAssistant, device_manager: DeviceManager) -> None:
         """Initialize my coordinator."""
@@ -20,31 +106,74 @@ class VestaCoordinator(DataUpdateCoordinator[dict[str, GizwitsDevice]]):
             hass,
             _LOGGER,
             name="Vesta Device Manager",
+            # Updates are pushed by the websocket, there is nothing to poll
+            update_interval=None,
         )
         self.device_manager = device_manager
         self.devices: dict[str, GizwitsDevice] = {}
+        self.device_infos: dict[str, DeviceInfo] = {}
+        self.states: dict[str, VestaState] = {}
+        self._remove_status_listener: Callable[[], None] | None = None
+        # Notify entities straight away, then coalesce bursts of websocket messages
+        self._status_debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=_STATUS_UPDATE_COOLDOWN,
+            immediate=True,
+            function=self._async_flush_status,
+        )
 
+    @callback
     def status_update(self, device: GizwitsDevice):
         self.devices[device.device_id] = device
+        self.states[device.device_id] = VestaState.from_device(device)
+        self._status_debouncer.async_schedule_call()
+
+    @callback
+    def _async_flush_status(self) -> None:
+        """Push the latest device status to the entities."""
         self.async_set_updated_data(self.devices)
 
+    async def async_shutdown(self) -> None:
+        """Stop listening to the device manager and cancel any pending status update."""
+        await super().async_shutdown()
+        if self._remove_status_listener is not None:
+            self._remove_status_listener()
+            self._remove_status_listener = None
+        self._status_debouncer.async_shutdown()
+
     async def async_config_entry_first_refresh(self) -> None:
         """Refresh data for the first time when a config entry is setup."""
         try:
-            async with asyncio.timeout(10):
-                self.device_manager.on("device_status_update", self.status_update)
+            async with asyncio.timeout(15):
+                if self._remove_status_listener is None:
+                    self.device_manager.on(_EVENT_STATUS_UPDATE, self.status_update)
+                    self._remove_status_listener = partial(
+                        self.device_manager.remove_listener,
+                        _EVENT_STATUS_UPDATE,
+                        self.status_update,
+                    )
                 self.devices = await self.device_manager.get_devices()
-                for device in self.devices.values():
-                    await device.subscribe_to_device_updates()
+                # Shared by reference between all the entities of a device
+                self.device_infos = {
+                    device.device_id: DeviceInfo(
+                        identifiers={(DOMAIN, device.device_id)},
+                        name=device.alias,
+                        model=device.product_name,
+                        manufacturer="Vesta",
+                    )
+                    for device in self.devices.values()
+                }
+                self.states = {
+                    device.device_id: VestaState.from_device(device)
+                    for device in self.devices.values()
+                }
+                await self.device_manager.subscribe_to_devices(self.devices.values())
         except Exception as err:
             _LOGGER.exception("Data update failed")
             raise UpdateFailed(f"Error communicating with API: {err}") from err
         await super().async_config_entry_first_refresh()
 
     async def _async_update_data(self) -> dict[str, GizwitsDevice]:
-        """Fetch data from API endpoint.
-
-        This is the place to pre-process the data to lookup tables
-        so entities can quickly look up their data.
-        """
+        """Return the cached devices, status changes are pushed by the websocket."""
         return self.devices
@@ -2,13 +2,21 @@
 
 from __future__ import annotations
 
+import asyncio
+from logging import getLogger
+import sys
+from typing import Any
+
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.helpers.entity import DeviceInfo, EntityDescription
+from homeassistant.core import callback
+from homeassistant.helpers.entity import EntityDescription
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .coordinator import VestaCoordinator
+from .coordinator import VestaCoordinator, VestaState
 from .pygizwits import GizwitsDevice
-from .const import DOMAIN
+
+_LOGGER = getLogger(__name__)
+_SET_ATTRIBUTES_TIMEOUT = 10
 
 
 class VestaEntity(CoordinatorEntity[VestaCoordinator]):
@@ -27,32 +35,55 @@ class VestaEntity(CoordinatorEntity[VestaCoordinator]):
         self.device = device
         self.entity_description = entity_description
         self._attr_name = entity_description.name
-        self._attr_unique_id = f"{device.device_id}_{entity_description.key}"
+        # Interned as the entity registry looks entities up by unique id
+        self._attr_unique_id = sys.intern(device.device_id + "_" + entity_description.key)
+        self._attr_device_info = coordinator.device_infos[device.device_id]
+        self._async_update_attrs()
 
     @property
-    def device_info(self) -> DeviceInfo:
-        return DeviceInfo(
-            identifiers={(DOMAIN, self.device.device_id)},
-            name=self.device.alias,
-            model=self.device.product_name,
-            manufacturer="Vesta",
-        )
-
-    @property
-    def vesta_device(self) -> GizwitsDevice | None:
-        return self.device
+    def vesta_state(self) -> VestaState:
+        """Get the parsed attributes of the device providing this entity."""
+        return self.coordinator.states[self.device.device_id]
 
     @property
     def status(self) -> bool | None:
         """Get status data for the cooker providing this entity."""
-        return self.device.is_online and bool(self.device.attributes)
+        return self._status
 
     @property
     def available(self) -> bool:
         """Return True if entity is available."""
-        return self.device.is_online
-    
+        return self._attr_available
+
     @property
     def should_poll(self) -> bool:
         return False
 
+    async def async_set_device_attributes(self, attributes: dict[str, Any]) -> bool:
+        """Send new attribute values to the device, returning False if it timed out."""
+        try:
+            async with asyncio.timeout(_SET_ATTRIBUTES_TIMEOUT):
+                await self.device.set_device_attributes(attributes)
+        except TimeoutError:
+            _LOGGER.warning("Timed out setting %s on %s", attributes, self.device.alias)
+            return False
+        return True
+
+    @callback
+    def _async_apply_optimistic(self, attributes: dict[str, Any]) -> None:
+        """Apply written attribute values locally, the websocket will confirm them."""
+        self.device.attributes.update(attributes)
+        self.coordinator.status_update(self.device)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Refresh the cached state and write it to Home Assistant."""
+        self._async_update_attrs()
+        super()._handle_coordinator_update()
+
+    @callback
+    def _async_update_attrs(self) -> None:
+        """Update the cached entity attributes from the device."""
+        self._attr_available = self.device.is_online
+        self._status = self._attr_available and bool(self.device.attributes)
+
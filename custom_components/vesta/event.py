@@ -18,15 +18,10 @@ async def async_setup_entry(
 ) -> None:
     coordinator: VestaCoordinator = hass.data[DOMAIN][config_entry.entry_id]
 
-    entities: list[VestaEntity] = []
-
-    for device in coordinator.device_manager.devices.values():
-        entities.extend(
-            [
-                VestaFinishedCookingEvent(coordinator, config_entry, device),
-            ]
-        )
-    async_add_entities(entities)
+    async_add_entities(
+        VestaFinishedCookingEvent(coordinator, config_entry, device)
+        for device in coordinator.device_manager.devices.values()
+    )
 
 
 class VestaFinishedCookingEvent(VestaEntity, EventEntity):
@@ -43,13 +38,17 @@ class VestaFinishedCookingEvent(VestaEntity, EventEntity):
             name="Finished cooking",
             event_types=["cooking_finish"]
         ))
+        self._last_finished = None
 
     @callback
-    def _async_handle_event(self) -> None:
+    def _handle_coordinator_update(self) -> None:
+        """Trigger the event when the cooking finishes, skipping unchanged updates."""
+        was_available = self._attr_available
+        self._async_update_attrs()
         finished = self.device.attributes.get("cooking_finish")
+        if finished == self._last_finished and was_available == self._attr_available:
+            return
+        self._last_finished = finished
         if finished:
             self._trigger_event(self.event_types[0], {"cooking_finish": finished})
-            self.async_write_ha_state()
-
-    async def async_added_to_hass(self) -> None:
-        self.coordinator.async_add_listener(self._async_handle_event)
+        self.async_write_ha_state()
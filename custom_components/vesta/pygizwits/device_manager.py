@@ -1,27 +1,53 @@
-from typing import Dict, cast
+import asyncio
+from typing import Dict, Iterable, List, Optional, Tuple
 
-from aiohttp import ClientSession
+from aiohttp import ClientSession, ClientTimeout, TCPConnector
+import orjson
 from pyee.base import EventEmitter
 
 from .exceptions import GizwitsDeviceNotBound
 from .gizwits_client import GizwitsClient
 from .gizwits_device import GizwitsDevice
+from .logger import logger
 from .websocket_connection import WebsocketConnection
 
 
+def _json_dumps(obj: object) -> str:
+    """Serializes request bodies with orjson."""
+    return orjson.dumps(obj).decode()
+
+
 class DeviceManager(EventEmitter):
     """Gizwits device manager."""
 
     def __init__(
         self,
-        session: ClientSession,
+        session: Optional[ClientSession],
         app_id: str,
         region: GizwitsClient.Region = GizwitsClient.Region.DEFAULT,
     ):
         super().__init__()
+        # Without a session from the caller, own one long-lived pooled session
+        self._owns_session = session is None
+        if session is None:
+            session = ClientSession(
+                connector=TCPConnector(
+                    limit=100,
+                    limit_per_host=10,
+                    keepalive_timeout=75,
+                    ttl_dns_cache=300,
+                    enable_cleanup_closed=True,
+                ),
+                timeout=ClientTimeout(total=30, connect=10),
+                json_serialize=_json_dumps,
+            )
         self.client = GizwitsClient(session, self, app_id, region)
-        self.sockets: Dict[str, WebsocketConnection] = {}
+        # Keyed by the (host, port) of the websocket server
+        self.sockets: Dict[Tuple[str, str], WebsocketConnection] = {}
+        self.socket_locks: Dict[Tuple[str, str], asyncio.Lock] = {}
         self.devices: Dict[str, GizwitsDevice] = {}
+        # Bound once, status updates are emitted for every websocket notification
+        self._emit_status = self.emit
 
     async def login(self, username: str, password: str) -> bool:
         """
@@ -38,6 +64,25 @@ class DeviceManager(EventEmitter):
         await self.client.login(username, password)
         return True
 
+    async def close(self) -> None:
+        """
+        Closes all websocket connections and stops the token refresh.
+
+        A session passed in by the caller is left open so it can keep serving
+        other requests, a session created by the manager is closed.
+
+        Returns:
+            None
+        """
+        self.client.close()
+        sockets = list(self.sockets.values())
+        self.sockets = {}
+        self.socket_locks = {}
+        for socket in sockets:
+            await socket.close()
+        if self._owns_session:
+            await self.client.session.close()
+
     async def get_devices(self):
         """
         Asynchronously retrieves the devices.
@@ -59,9 +104,56 @@ class DeviceManager(EventEmitter):
         Raises:
             GizwitsDeviceNotBound: If the device ID is not found.
         """
-        if device_id not in self.devices:
-            raise GizwitsDeviceNotBound(device_id)
-        return self.devices[device_id]
+        try:
+            return self.devices[device_id]
+        except KeyError:
+            raise GizwitsDeviceNotBound(device_id) from None
+
+    async def subscribe_to_devices(self, devices: Iterable[GizwitsDevice]) -> None:
+        """
+        Subscribes to updates from the given devices via WebSocket connections.
+
+        Devices sharing a WebSocket server share one connection and are
+        subscribed with a single request.
+
+        Args:
+            devices (Iterable[GizwitsDevice]): The devices to subscribe to.
+        Returns:
+            None
+        """
+        grouped: Dict[Tuple[str, str], List[GizwitsDevice]] = {}
+        for device in devices:
+            grouped.setdefault(device.get_websocket_key(), []).append(device)
+        await asyncio.gather(
+            *(self._subscribe_on_socket(key, group) for key, group in grouped.items())
+        )
+
+    async def _subscribe_on_socket(
+        self, key: Tuple[str, str], devices: List[GizwitsDevice]
+    ) -> None:
+        """
+        Subscribes devices sharing a WebSocket server, connecting to it if needed.
+
+        Args:
+            key (Tuple[str, str]): The host and port of the WebSocket server.
+            devices (List[GizwitsDevice]): The devices to subscribe to.
+        Returns:
+            None
+        """
+        # Concurrent subscriptions wait for the first one to open the socket
+        lock = self.socket_locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            socket = self.sockets.get(key)
+            if socket is None:
+                websocket_info, websocket_url = devices[0].get_websocket_conn_info()
+                logger.debug("Creating websocket for %s", websocket_url)
+                socket = WebsocketConnection(self.client.session, self, websocket_info)
+                await socket.connect()
+                await socket.login()
+                self.sockets[key] = socket
+            else:
+                logger.debug("Using existing websocket for %s:%s", *key)
+            await socket.add_device_subs([device.device_id for device in devices])
 
     async def sync_devices(self):
         """
@@ -81,7 +173,9 @@ class DeviceManager(EventEmitter):
         Returns:
             None
         """
-        did = device_update["did"]
-        device_info = cast(GizwitsDevice, self.devices.get(did))
+        device_info = self.devices.get(device_update["did"])
+        if device_info is None:
+            # Update for a device that is not bound (anymore)
+            return
         device_info.attributes = device_update["attrs"]
-        self.emit('device_status_update', device_info)
+        self._emit_status('device_status_update', device_info)
@@ -1,6 +1,5 @@
-import json
-
 from aiohttp import ClientResponse
+import orjson
 
 
 class GizwitsException(Exception):
@@ -31,27 +30,13 @@ class GizwitsIncorrectPasswordException(GizwitsAuthException):
     """Password is incorrect."""
 
 
-class ErrorCodes:
-    """An exception returned via the API."""
-
-    ERROR_CODES = {
-        9004: GizwitsTokenInvalidException,
-        9005: GizwitsUserDoesNotExistException,
-        9042: GizwitsOfflineException,
-        9020: GizwitsIncorrectPasswordException,
-    }
-
-    @classmethod
-    def get_exception(cls, error_code):
-        """
-        Get the exception class corresponding to the given error code.
-
-        Args:
-            error_code (error_code): The error code to lookup.
-        Returns:
-            GizwitsException: The exception class corresponding to the given error code.
-        """
-        return cls.ERROR_CODES.get(error_code, GizwitsException)
+# Exceptions raised for the error codes returned by the API
+_ERROR_CODES: dict[int, type[GizwitsException]] = {
+    9004: GizwitsTokenInvalidException,
+    9005: GizwitsUserDoesNotExistException,
+    9042: GizwitsOfflineException,
+    9020: GizwitsIncorrectPasswordException,
+}
 
 
 async def raise_for_status(response: ClientResponse) -> None:
@@ -60,8 +45,9 @@ async def raise_for_status(response: ClientResponse) -> None:
 
     Checks if the provided response is OK. If not, tries to decode the error message
     from the response JSON. If successful, raises an exception based on the error
-    code. If the error message cannot be decoded or the error code is not recognized,
-    raises an HTTPError with the status code of the response. Returns None otherwise.
+    code, or a GizwitsException if the error code is not recognized. If the error
+    message cannot be decoded, raises an HTTPError with the status code of the
+    response. Returns None otherwise.
 
     Args:
         response (ClientResponse): A ClientResponse object from an aiohttp request.
@@ -72,11 +58,11 @@ async def raise_for_status(response: ClientResponse) -> None:
         return
 
     api_error = None
+    # Read the body once, the API does not always set the JSON content type
+    body = await response.read()
     try:
-        api_error = await response.json()
-    except json.JSONDecodeError:
+        api_error = orjson.loads(body)
+    except orjson.JSONDecodeError:
         response.raise_for_status()
     error_code = api_error.get("error_code", 0) if api_error else 0
-    if exception_class := ErrorCodes.get_exception(error_code):
-        raise exception_class
-    response.raise_for_status()
+    raise _ERROR_CODES.get(error_code, GizwitsException)()
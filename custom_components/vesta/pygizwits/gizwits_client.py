@@ -1,23 +1,72 @@
 import asyncio
 from dataclasses import dataclass
 from enum import Enum
-from time import time
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
-from urllib.parse import urljoin
+from functools import partial
+import logging
+from time import monotonic, time
+from typing import TYPE_CHECKING, Any, Coroutine, Dict, List, Optional, Set, Tuple
 
 from aiohttp import ClientError, ClientSession
+import orjson
 
 if TYPE_CHECKING:
     from .device_manager import DeviceManager
 
-from .exceptions import (
-    GizwitsDeviceNotBound,
-    GizwitsException,
-    raise_for_status,
-)
+from .exceptions import GizwitsException, raise_for_status
 from .gizwits_device import GizwitsDevice
 from .logger import logger
 
+_BINDINGS_PAGE_SIZE = 20
+_BINDINGS_PREFETCH_PAGES = 4
+# Attributes set on a device within this many seconds are sent in one request
+_CONTROL_BATCH_DELAY = 0.02
+# Seconds the bindings are reused for by refresh_bindings
+_BINDINGS_TTL = 900
+# Seconds a device's latest data is reused for by back-to-back fetches
+_LATEST_DATA_TTL = 2.0
+
+
+def _create_eager_task(coro: Coroutine[Any, Any, Any], name: str) -> asyncio.Task:
+    """
+    Creates a task that starts running immediately.
+
+    Args:
+        coro (Coroutine): The coroutine to run.
+        name (str): The name of the task.
+    Returns:
+        asyncio.Task: The task.
+    """
+    return asyncio.Task(
+        coro, loop=asyncio.get_running_loop(), name=name, eager_start=True
+    )
+
+
+def _fail_controls(futures: List[asyncio.Future], cause: Optional[Exception]) -> None:
+    """
+    Fails the callers waiting on attributes that could not be set.
+
+    Each caller gets its own exception, as raising it updates its traceback.
+
+    Args:
+        futures (List[asyncio.Future]): The futures of the waiting callers.
+        cause (Optional[Exception]): The error that prevented the request, or
+        None if the client was closed before it completed.
+    Returns:
+        None
+    """
+    for future in futures:
+        # Callers that timed out have already cancelled their future
+        if future.done():
+            continue
+        if cause is None:
+            error = GizwitsException("Client closed before setting device attributes.")
+        else:
+            error = GizwitsException(
+                "Unknown error occurred while setting device attributes."
+            )
+            error.__cause__ = cause
+        future.set_exception(error)
+
 
 @dataclass
 class GizwitsUserToken:
@@ -48,15 +97,38 @@ class GizwitsClient:
         device_manager: 'DeviceManager',
         app_id: str,
         region: Region = Region.DEFAULT,
+        max_concurrent_requests: int = 10,
     ):
         self.base_url = self.get_base_url(region)
+        # The endpoints are all absolute paths, so plain concatenation is enough
+        self._base = self.base_url.rstrip("/")
+        self._latest_endpoints: Dict[str, str] = {}
+        self._control_endpoints: Dict[str, str] = {}
+        self._bindings_expiry: float = 0.0
+        self._latest_data: Dict[str, Tuple[float, Dict[str, Any]]] = {}
         self.region = region
         self.app_id = app_id
         self.token: str = ""
         self.uid: str = ""
+        self._login_headers: Dict[str, str] = {"X-Gizwits-Application-Id": self.app_id}
+        # Rebuilt whenever the token changes instead of on every request
+        self._headers: Dict[str, str] = {
+            "X-Gizwits-Application-Id": self.app_id,
+            "X-Gizwits-User-Token": self.token,
+        }
         self.session = session
+        # Limits the requests in flight so large accounts do not flood the API
+        self._request_semaphore = asyncio.Semaphore(max_concurrent_requests)
         self.device_manager = device_manager
-        self.task = None
+        self.task: Optional[asyncio.Task] = None
+        # The login requests in flight by credentials, shared by concurrent callers
+        self._token_tasks: Dict[Tuple[str, str], asyncio.Task] = {}
+        # Attributes waiting to be sent and the callers waiting on them, per device
+        self._pending_controls: Dict[
+            str, Tuple[Dict[str, Any], List[asyncio.Future]]
+        ] = {}
+        self._control_handles: Dict[str, asyncio.TimerHandle] = {}
+        self._control_tasks: Set[asyncio.Task] = set()
 
     @staticmethod
     def get_base_url(region: Region) -> str:
@@ -86,6 +158,9 @@ class GizwitsClient:
         """
         Retrieves the user token using the provided username and password.
 
+        Concurrent callers with the same credentials share a single login
+        request, as the API rate limits logins.
+
         Args:
             username (str): The username for the login request.
             password (str): The password for the login request.
@@ -94,19 +169,54 @@ class GizwitsClient:
         Raises:
             GizwitsException: If an error occurs during the token retrieval process.
         """
-        # Set the URL and headers
-        url = urljoin(self.base_url, "/app/login")
-        headers = {"X-Gizwits-Application-Id": self.app_id}
+        credentials = (username, password)
+        task = self._token_tasks.get(credentials)
+        if task is None:
+            task = asyncio.get_running_loop().create_task(
+                self._request_token(username, password), name="gizwits-login"
+            )
+            self._token_tasks[credentials] = task
+            task.add_done_callback(partial(self._forget_token_task, credentials))
+        # A caller being cancelled must not cancel the login for the others
+        return await asyncio.shield(task)
+
+    def _forget_token_task(self, credentials: Tuple[str, str], task: asyncio.Task) -> None:
+        """
+        Forgets a finished login, so the next one or a retry makes a new request.
+
+        Args:
+            credentials (Tuple[str, str]): The username and password of the login.
+            task (asyncio.Task): The finished login task.
+        Returns:
+            None
+        """
+        if self._token_tasks.get(credentials) is task:
+            del self._token_tasks[credentials]
+
+    async def _request_token(self, username: str, password: str) -> GizwitsUserToken:
+        """
+        Requests a user token using the provided username and password.
+
+        Args:
+            username (str): The username for the login request.
+            password (str): The password for the login request.
+        Returns:
+            GizwitsUserToken: An instance of GizwitsUserToken.
+        Raises:
+            GizwitsException: If an error occurs during the token retrieval process.
+        """
+        # Set the URL
+        url = self._base + "/app/login"
 
         # Set the payload
         payload = {"username": username, "password": password[0:16], "lang": "en"}
 
         # Send a POST request and get the response
-        async with self.session.post(url, headers=headers, json=payload) as response:
+        async with self.session.post(url, headers=self._login_headers, json=payload) as response:
             await raise_for_status(response)
 
             # Extract the token and uid from the response
-            data = await response.json()
+            data = await response.json(content_type=None, loads=orjson.loads)
 
         # Return the uid and token
         return GizwitsUserToken(data["uid"], data["token"], data["expire_at"])
@@ -132,9 +242,19 @@ class GizwitsClient:
         login_data = await self.get_token(username, password)
         self.token = login_data.user_token
         self.uid = login_data.user_id
+        self._headers = {
+            "X-Gizwits-Application-Id": self.app_id,
+            "X-Gizwits-User-Token": self.token,
+        }
         # Schedule the token refresh
         expiry_time = login_data.expiry - int(time())  # Calculate time remaining until expiry
-        self.task = asyncio.create_task(self.refresh_token(expiry_time, username, password))
+        # Replace any refresh already scheduled, unless it is the one logging in now
+        if self.task is not None and self.task is not asyncio.current_task():
+            self.task.cancel()
+        self.task = _create_eager_task(
+            self.refresh_token(expiry_time, username, password),
+            name="gizwits-token-refresh",
+        )
 
     async def refresh_token(self, expiry_time, username, password):
         """
@@ -159,6 +279,30 @@ class GizwitsClient:
         # Refresh the token
         await self.login(username, password)
 
+    def close(self) -> None:
+        """
+        Cancels the scheduled token refresh, any login in flight and the
+        attributes still waiting to be sent, failing their callers.
+
+        Returns:
+            None
+        """
+        if self.task is not None:
+            self.task.cancel()
+            self.task = None
+        for token_task in self._token_tasks.values():
+            token_task.cancel()
+        self._token_tasks.clear()
+        for handle in self._control_handles.values():
+            handle.cancel()
+        self._control_handles.clear()
+        for _, futures in self._pending_controls.values():
+            _fail_controls(futures, None)
+        self._pending_controls.clear()
+        # Their callers are failed by _send_controls when it is cancelled
+        for task in self._control_tasks:
+            task.cancel()
+
     async def _get(self, endpoint: str) -> Dict[str, Any]:
         """
         An async function that retrieves data from a specific API endpoint.
@@ -168,17 +312,16 @@ class GizwitsClient:
         Returns:
             Dict[str, Any]: A dictionary containing the response data.
         """
-        url = urljoin(self.base_url, endpoint)
-        headers = {
-            "X-Gizwits-Application-Id": self.app_id,
-            "X-Gizwits-User-Token": self.token,
-        }
+        url = self._base + endpoint
 
-        async with self.session.get(url, headers=headers) as response:
-            await raise_for_status(response)
-            # Needed as the api does not always set the correct content type
-            response_json: Dict[str, Any] = await response.json(content_type=None)
-            return response_json
+        async with self._request_semaphore:
+            async with self.session.get(url, headers=self._headers) as response:
+                await raise_for_status(response)
+                # Needed as the api does not always set the correct content type
+                response_json: Dict[str, Any] = await response.json(
+                    content_type=None, loads=orjson.loads
+                )
+                return response_json
 
     async def _post(self, endpoint: str, data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -192,18 +335,16 @@ class GizwitsClient:
             Dict[str, Any]: A dictionary representing the JSON data
             returned by the response.
         """
-        url = urljoin(self.base_url, endpoint)
-        headers = {
-            "X-Gizwits-Application-Id": self.app_id,
-            "X-Gizwits-User-Token": self.token,
-        }
-        headers = {k: v if v is not None else "" for k, v in headers.items()}
-        post = self.session.post(url, headers=headers, json=data)
-        async with post as response:
-            await raise_for_status(response)
-            # Needed as the api does not always set the correct content type
-            response_json: Dict[str, Any] = await response.json(content_type=None)
-            return response_json
+        url = self._base + endpoint
+        async with self._request_semaphore:
+            post = self.session.post(url, headers=self._headers, json=data)
+            async with post as response:
+                await raise_for_status(response)
+                # Needed as the api does not always set the correct content type
+                response_json: Dict[str, Any] = await response.json(
+                    content_type=None, loads=orjson.loads
+                )
+                return response_json
 
     async def get_bindings(
         self, device_manager: 'DeviceManager', device_types: Optional[List[str]] = None
@@ -223,48 +364,44 @@ class GizwitsClient:
             GizwitsException: if an error occurs while retrieving the device bindings.
         """
         bound_devices: Dict[str, GizwitsDevice] = {}
-        limit = 20
-        skip = 0
-        more = True
-        url = "/app/bindings"
-        while more:
-            query = f"?show_disabled=0&limit={limit}&skip={skip}"
-            endpoint = url + query
-            try:
-                response_data = await self._get(endpoint)
-                devices = response_data.get('devices', [])
+        limit = _BINDINGS_PAGE_SIZE
+        try:
+            pages = [await self._get_bindings_page(limit, 0)]
+            skip = limit
+            # A full page means there may be more, fetch the next pages together
+            while len(pages[-1]) == limit:
+                batch = await asyncio.gather(
+                    *(
+                        self._get_bindings_page(limit, skip + page * limit)
+                        for page in range(_BINDINGS_PREFETCH_PAGES)
+                    )
+                )
+                skip += _BINDINGS_PREFETCH_PAGES * limit
+                for devices in batch:
+                    pages.append(devices)
+                    if len(devices) < limit:
+                        break
+            for devices in pages:
                 for device in devices:
-                    did = device["did"]
-                    bound_devices[did] = GizwitsDevice(
-                        device["did"],
-                        device["dev_alias"],
-                        device["product_name"],
-                        device['mac'],
-                        device['ws_port'],
-                        device['host'],
-                        device['wss_port'],
-                        device['protoc'],
-                        device["mcu_soft_version"],
-                        device["mcu_hard_version"],
-                        device["wifi_soft_version"],
-                        device["is_online"],
-                        self,
-                        device_manager,
+                    bound_devices[device["did"]] = self._device_from_binding(
+                        device_manager, device
                     )
-                if len(devices) == limit:
-                    skip += limit
-                else:
-                    more = False
-            except ClientError as e:
-                logger.error("Request error: %s", e)
-                raise GizwitsException(
-                    "Error occurred while retrieving device bindings."
-                ) from e
-            except Exception as e:
-                logger.error("Error: %s", e)
-                raise GizwitsException(
-                    "Unknown error occurred while retrieving device bindings."
-                ) from e
+            self._latest_endpoints = {
+                did: f"/app/devdata/{did}/latest" for did in bound_devices
+            }
+            self._control_endpoints = {
+                did: f"/app/control/{did}" for did in bound_devices
+            }
+        except ClientError as e:
+            logger.error("Request error: %s", e)
+            raise GizwitsException(
+                "Error occurred while retrieving device bindings."
+            ) from e
+        except Exception as e:
+            logger.error("Error: %s", e)
+            raise GizwitsException(
+                "Unknown error occurred while retrieving device bindings."
+            ) from e
         if device_types is not None:
             filtered_devices = {
                 did: device
@@ -275,18 +412,140 @@ class GizwitsClient:
             return filtered_devices
 
         device_manager.devices = bound_devices
+        self._bindings_expiry = monotonic() + _BINDINGS_TTL
         return bound_devices
 
-    async def refresh_bindings(self, device_manager: 'DeviceManager') -> None:
+    async def _get_bindings_page(self, limit: int, skip: int) -> List[Dict[str, Any]]:
+        """
+        Asynchronously retrieves one page of device bindings.
+
+        Args:
+            limit (int): The maximum number of devices in the page.
+            skip (int): The number of devices to skip.
+        Returns:
+            List[Dict[str, Any]]: The devices in the page.
+        """
+        query = f"?show_disabled=0&limit={limit}&skip={skip}"
+        response_data = await self._get("/app/bindings" + query)
+        return response_data.get('devices', [])
+
+    def _device_from_binding(
+        self, device_manager: 'DeviceManager', device: Dict[str, Any]
+    ) -> GizwitsDevice:
+        """
+        Creates a GizwitsDevice from a binding, or updates the existing one.
+
+        Reusing the existing device keeps its attributes and websocket stable.
+
+        Args:
+            device_manager (DeviceManager): The device manager.
+            device (Dict[str, Any]): The binding returned by the API.
+        Returns:
+            GizwitsDevice: The device.
+        """
+        existing = device_manager.devices.get(device["did"])
+        if existing is None:
+            return GizwitsDevice(
+                device["did"],
+                device["dev_alias"],
+                device["product_name"],
+                device['mac'],
+                device['ws_port'],
+                device['host'],
+                device['wss_port'],
+                device['protoc'],
+                device["mcu_soft_version"],
+                device["mcu_hard_version"],
+                device["wifi_soft_version"],
+                device["is_online"],
+                self,
+                device_manager,
+            )
+        existing.alias = device["dev_alias"]
+        existing.product_name = device["product_name"]
+        existing.mac = device['mac']
+        existing.ws_port = device['ws_port']
+        existing.host = device['host']
+        existing.wss_port = device['wss_port']
+        existing.protocol_version = device['protoc']
+        existing.mcu_soft_version = device["mcu_soft_version"]
+        existing.mcu_hard_version = device["mcu_hard_version"]
+        existing.wifi_soft_version = device["wifi_soft_version"]
+        existing.is_online = device["is_online"]
+        existing.update_websocket_conn_info()
+        return existing
+
+    async def refresh_bindings(
+        self, device_manager: 'DeviceManager', force: bool = False
+    ) -> None:
         """
         Asynchronously refreshes the bindings of the current session
 
+        The bindings rarely change, so they are only retrieved again once the
+        previous ones are older than the bindings TTL.
+
+        Args:
+            device_manager (DeviceManager): The device manager.
+            force (bool): Whether to retrieve the bindings even if still fresh.
         Returns:
             None
         """
+        if (
+            not force
+            and self.device_manager.devices
+            and monotonic() < self._bindings_expiry
+        ):
+            return
         self.device_manager.devices = await self.get_bindings(device_manager)
         self.device_manager.emit('bindings_refreshed', self.device_manager.devices)
 
+    def _latest_endpoint(self, device_id: str) -> str:
+        """
+        Retrieves the latest data endpoint of a device.
+
+        Args:
+            device_id (str): The ID of the device.
+        Returns:
+            str: The endpoint, cached when the bindings were retrieved.
+        """
+        endpoint = self._latest_endpoints.get(device_id)
+        if endpoint is None:
+            endpoint = self._latest_endpoints[device_id] = f"/app/devdata/{device_id}/latest"
+        return endpoint
+
+    def _control_endpoint(self, device_id: str) -> str:
+        """
+        Retrieves the control endpoint of a device.
+
+        Args:
+            device_id (str): The ID of the device.
+        Returns:
+            str: The endpoint, cached when the bindings were retrieved.
+        """
+        endpoint = self._control_endpoints.get(device_id)
+        if endpoint is None:
+            endpoint = self._control_endpoints[device_id] = f"/app/control/{device_id}"
+        return endpoint
+
+    async def _get_latest_data(self, device_id: str) -> Dict[str, Any]:
+        """
+        Asynchronously retrieves the latest data of a device.
+
+        Data retrieved less than the latest data TTL ago is reused, so fetches
+        in quick succession do not request it again.
+
+        Args:
+            device_id (str): The ID of the device.
+        Returns:
+            Dict[str, Any]: The latest data returned by the API.
+        """
+        cached = self._latest_data.get(device_id)
+        if cached is not None and monotonic() - cached[0] < _LATEST_DATA_TTL:
+            return cached[1]
+        latest_data = await self._get(self._latest_endpoint(device_id))
+        self._latest_data[device_id] = (monotonic(), latest_data)
+        return latest_data
+
     async def fetch_device(self, device_id: str) -> GizwitsDevice:
         """
         Asynchronously fetches the latest data for a specific device.
@@ -298,11 +557,9 @@ class GizwitsClient:
         Raises:
             GizwitsDeviceNotBound: if the device is not bound.
         """
-        if device_id not in self.device_manager.devices:
-            raise GizwitsDeviceNotBound()
-        device_info = self.device_manager.devices[device_id]
+        device_info = self.device_manager.get_device(device_id)
         logger.debug("Fetching device %s", device_id)
-        latest_data = await self._get(f"/app/devdata/{device_id}/latest")
+        latest_data = await self._get_latest_data(device_id)
         # Get the age of the data according to the API
         api_update_timestamp = latest_data["updated_at"]
 
@@ -312,16 +569,22 @@ class GizwitsClient:
             # In testing, the 'attrs' dictionary has been observed to be empty
             device_info.is_online = False
             device_info.attributes = {}
+            device_info.last_updated_at = 0
             return device_info
 
-        device_info.attributes = latest_data
+        # Only guards against out of order REST responses: websocket pushes
+        # carry no timestamp, so last_updated_at only tracks the API data
+        if api_update_timestamp > device_info.last_updated_at:
+            device_info.last_updated_at = api_update_timestamp
+            device_info.attributes = latest_data
         return device_info
 
     async def fetch_devices(self) -> dict[str, GizwitsDevice]:
         """
         Asynchronously fetches the latest data for all currently bound devices.
 
-        Only devices that are currently bound will be included in the results.
+        Only devices that are currently bound and online will be included in the
+        results. Offline devices are skipped until the bindings are refreshed.
 
         Returns:
             A dictionary where each key is a device ID and each value is a
@@ -333,9 +596,20 @@ class GizwitsClient:
         if not self.device_manager.devices:
             return results
 
-        for did, device_info in self.device_manager.devices.items():
-            logger.debug("Fetching device %s", did)
-            latest_data = await self._get(f"/app/devdata/{did}/latest")
+        dids = [did for did, device in self.device_manager.devices.items() if device.is_online]
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Fetching %d devices: %s", len(dids), ", ".join(dids))
+        # The devices are independent, so fetch them all concurrently
+        responses = await asyncio.gather(
+            *(self._get_latest_data(did) for did in dids),
+            return_exceptions=True,
+        )
+
+        for did, latest_data in zip(dids, responses):
+            if isinstance(latest_data, BaseException):
+                logger.error("Error fetching device %s: %s", did, latest_data)
+                continue
+            device_info = self.device_manager.devices[did]
             # Get the age of the data according to the API
             api_update_timestamp = latest_data["updated_at"]
 
@@ -347,27 +621,30 @@ class GizwitsClient:
                 # empty
                 device_info.is_online = False
                 device_info.attributes = {}
+                device_info.last_updated_at = 0
                 continue
 
-            device_info.attributes = latest_data
+            # Only guards against out of order REST responses, see fetch_device
+            if api_update_timestamp > device_info.last_updated_at:
+                device_info.last_updated_at = api_update_timestamp
+                device_info.attributes = latest_data
             results[did] = device_info
         return results
 
-    async def set_device_attribute(
+    def set_device_attribute(
         self, device_id: str, attribute: str, value: Any
-    ) -> None:
+    ) -> Coroutine[Any, Any, None]:
         """
-        Asynchronously sets the value of a device attribute.
+        Sets the value of a device attribute.
 
         Args:
             device_id (str): The ID of the device.
             attribute (str): The name of the attribute.
             value (Any): The value to set.
         Returns:
-            Coroutine
+            Coroutine: Awaitable that completes once the attribute is set.
         """
-        await self.set_device_attributes(device_id, {attribute: value})
-        return
+        return self.set_device_attributes(device_id, {attribute: value})
 
     async def set_device_attributes(
         self, device_id: str, attributes: dict[str, Any]
@@ -375,20 +652,76 @@ class GizwitsClient:
         """
         Asynchronously sets the value of multiple device attributes.
 
+        Attributes set on the same device in quick succession are merged and
+        sent in a single request, which all the callers wait on.
+
         Args:
             device_id (str): The ID of the device.
             attributes (dict[str, Any]): The attributes to set.
         Returns:
             None
         """
-        if device_id not in self.device_manager.devices:
-            raise GizwitsDeviceNotBound()
-        payload: Dict[str, Any] = {"attrs": dict(attributes)}
+        # Raises GizwitsDeviceNotBound for unknown devices
+        self.device_manager.get_device(device_id)
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        pending = self._pending_controls.get(device_id)
+        if pending is None:
+            pending = self._pending_controls[device_id] = ({}, [])
+            self._control_handles[device_id] = loop.call_later(
+                _CONTROL_BATCH_DELAY, self._flush_controls, device_id
+            )
+        pending[0].update(attributes)
+        pending[1].append(future)
+        await future
+
+    def _flush_controls(self, device_id: str) -> None:
+        """
+        Sends the attributes pending for a device.
+
+        Args:
+            device_id (str): The ID of the device.
+        Returns:
+            None
+        """
+        del self._control_handles[device_id]
+        attributes, futures = self._pending_controls.pop(device_id)
+        task = _create_eager_task(
+            self._send_controls(device_id, attributes, futures),
+            name="gizwits-control",
+        )
+        if not task.done():
+            self._control_tasks.add(task)
+            task.add_done_callback(self._control_tasks.discard)
+
+    async def _send_controls(
+        self,
+        device_id: str,
+        attributes: Dict[str, Any],
+        futures: List[asyncio.Future],
+    ) -> None:
+        """
+        Asynchronously sends attributes to a device and resolves its callers.
+
+        Args:
+            device_id (str): The ID of the device.
+            attributes (Dict[str, Any]): The merged attributes to set.
+            futures (List[asyncio.Future]): The futures of the waiting callers.
+        Returns:
+            None
+        """
+        payload: Dict[str, Any] = {"attrs": attributes}
+        # The cached latest data no longer reflects the device
+        self._latest_data.pop(device_id, None)
         try:
-            await self._post(f"/app/control/{device_id}", payload)
+            await self._post(self._control_endpoint(device_id), payload)
+        except asyncio.CancelledError:
+            _fail_controls(futures, None)
+            raise
         except Exception as e:
             logger.error("Error: %s", e)
-            raise GizwitsException(
-                "Unknown error occurred while setting device attributes."
-            ) from e
-        return
+            _fail_controls(futures, e)
+            return
+        for future in futures:
+            if not future.done():
+                future.set_result(None)
@@ -1,21 +1,37 @@
-from dataclasses import dataclass
-from time import time
-from typing import TYPE_CHECKING, Any, Dict
-
-from .logger import logger
+from typing import TYPE_CHECKING, Any, Coroutine, Dict
 
 if TYPE_CHECKING:
     from .gizwits_client import GizwitsClient
     from .device_manager import DeviceManager
-
-from .websocket_connection import WebsocketConnection
-
-_CONNECTIVITY_TIMEOUT = 1000
+    from .websocket_connection import WebsocketConnection
 
 
 class GizwitsDevice:
     """Gizwits device."""
 
+    __slots__ = (
+        'device_id',
+        'alias',
+        'product_name',
+        'mac',
+        'ws_port',
+        'host',
+        'wss_port',
+        'protocol_version',
+        'mcu_soft_version',
+        'mcu_hard_version',
+        'wifi_soft_version',
+        'is_online',
+        'attributes',
+        'last_updated_at',
+        'client_connection',
+        'device_manager',
+        '_socketType',
+        'websocket_connection',
+        '_ws_info',
+        '_ws_url',
+    )
+
     def __init__(
         self,
         device_id,
@@ -46,10 +62,32 @@ class GizwitsDevice:
         self.wifi_soft_version = wifi_soft_version
         self.is_online = is_online
         self.attributes: Dict[str, Any] = {}
+        # The API timestamp of the latest attributes fetched over REST, websocket
+        # pushes do not carry one so they leave it untouched
+        self.last_updated_at: int = 0
         self.client_connection: 'GizwitsClient' = client_connection
         self.device_manager: 'DeviceManager' = device_manager
         self._socketType = "ssl_socket"
         self.websocket_connection: 'WebsocketConnection'
+        self._ws_info: Dict[str, str]
+        self._ws_url: str
+        self.update_websocket_conn_info()
+
+    def update_websocket_conn_info(self) -> None:
+        """
+        Computes the WebSocket connection information from the host and ports.
+
+        Must be called again whenever the host or the ports change.
+
+        Returns:
+            None
+        """
+        if self._socketType == "ssl_socket":
+            pre, port = "wss://", self.wss_port
+        else:
+            pre, port = "ws://", self.ws_port
+        self._ws_info = {'host': self.host, 'path': '/ws/app/v1', 'pre': pre, 'port': str(port)}
+        self._ws_url = f"{pre}{self.host}:{port}/ws/app/v1"
 
     def get_websocket_conn_info(self) -> tuple[dict[str, str], str]:
         """
@@ -58,17 +96,15 @@ class GizwitsDevice:
             A tuple containing a dictionary with keys 'host', 'path', 'pre', and 'port',
             and a string representing the WebSocket connection URL.
         """
-        ws_info: Dict[str, str] = {'host': self.host, 'path': '/ws/app/v1'}
-        if self._socketType == "ssl_socket":
-            ws_info['pre'] = "wss://"
-            ws_info['port'] = str(self.wss_port)
-        else:
-            ws_info['pre'] = "ws://"
-            ws_info['port'] = str(self.ws_port)
-        return (
-            ws_info,
-            f"{ws_info['pre']}{ws_info['host']}:{ws_info['port']}{ws_info['path']}",
-        )
+        return self._ws_info, self._ws_url
+
+    def get_websocket_key(self) -> tuple[str, str]:
+        """
+        Get the key identifying the WebSocket server of the device.
+        Returns:
+            A tuple containing the host and the port of the WebSocket server.
+        """
+        return self._ws_info['host'], self._ws_info['port']
 
     async def subscribe_to_device_updates(self):
         """
@@ -78,20 +114,7 @@ class GizwitsDevice:
         Returns:
             None
         """
-        websocket_info, websocket_url = self.get_websocket_conn_info()
-        sockets: Dict[str, WebsocketConnection] = self.device_manager.sockets
-        if websocket_url in sockets:
-            logger.debug("Using existing websocket for %s", websocket_url)
-            await sockets[websocket_url].add_device_sub(self.device_id)
-        else:
-            logger.debug("Creating websocket for %s", websocket_url)
-            socket = WebsocketConnection(
-                self.device_manager.client.session, self.device_manager, websocket_info
-            )
-            await socket.connect()
-            await socket.login()
-            await socket.add_device_sub(self.device_id)
-            sockets[websocket_url] = socket
+        await self.device_manager.subscribe_to_devices([self])
 
     async def get_device_status(self):
         """
@@ -101,7 +124,7 @@ class GizwitsDevice:
         """
         return await self.client_connection.fetch_device(self.device_id)
 
-    async def set_device_attribute(self, key, value):
+    def set_device_attribute(self, key: str, value: Any) -> Coroutine[Any, Any, None]:
         """
         Set a device attribute.
 
@@ -109,34 +132,24 @@ class GizwitsDevice:
             key: The key of the attribute to set.
             value: The value to set for the attribute.
         Returns:
-            The result of setting the attribute.
+            Coroutine: Awaitable that completes once the attribute is set.
         """
-        return await self.client_connection.set_device_attribute(
+        return self.client_connection.set_device_attribute(
             self.device_id, key, value
         )
 
-    async def set_device_attributes(self, attributes):
+    def set_device_attributes(
+        self, attributes: Dict[str, Any]
+    ) -> Coroutine[Any, Any, None]:
         """
         Set a device attributes.
 
         Args:
             attributes (dict[str, Any]): The attributes to set.
         Returns:
-            The result of setting the attribute.
+            Coroutine: Awaitable that completes once the attributes are set.
         """
-        return await self.client_connection.set_device_attributes(
+        return self.client_connection.set_device_attributes(
             self.device_id, attributes
         )
 
-
-@dataclass
-class GizwitsDeviceStatus:
-    """A snapshot of the status of a device."""
-
-    timestamp: int
-    attributes: dict[str, Any]
-
-    @property
-    def online(self) -> bool:
-        """Determine if the device is online based on the age of the latest update."""
-        return self.timestamp > (time() - _CONNECTIVITY_TIMEOUT)
@@ -1,8 +1,8 @@
 import asyncio
-import json
-from typing import TYPE_CHECKING, Any, Dict, cast
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Optional
 
 from aiohttp import ClientSession, ClientWebSocketResponse, WSMsgType
+import orjson
 
 if TYPE_CHECKING:
     from .device_manager import DeviceManager
@@ -10,6 +10,13 @@ if TYPE_CHECKING:
 
 from .logger import logger
 
+# Message types after which no more messages will be received
+_TERMINAL_MESSAGE_TYPES = frozenset(
+    (WSMsgType.CLOSE, WSMsgType.CLOSING, WSMsgType.CLOSED, WSMsgType.ERROR)
+)
+# The ping never changes, so it is serialized once
+_PING_MESSAGE = orjson.dumps({"cmd": "ping"}).decode()
+
 
 class WebsocketConnection:
     """WebSocket connection to the Gizwits server."""
@@ -26,12 +33,20 @@ class WebsocketConnection:
             + websocket_info['port']
             + websocket_info['path']
         )
-        self.connection: ClientWebSocketResponse
+        self.connection: Optional[ClientWebSocketResponse] = None
         self.logged_in: bool = False
         self.subscribed_devices: list[str] = []
+        self._subscribed_set: set[str] = set()
+        # Devices a subscription request was sent for, confirmed or not
+        self._requested_subs: set[str] = set()
         self.ping_interval = 180
-        self.ping_task: asyncio.Task
-        self.receive_messages_task: asyncio.Task
+        self.ping_task: Optional[asyncio.Task] = None
+        self.receive_messages_task: Optional[asyncio.Task] = None
+        self._handlers: Dict[str, Callable[[Dict], Awaitable[None]]] = {
+            "login_res": self.handle_login_response,
+            "subscribe_res": self.handle_device_subscribe_response,
+            "s2c_noti": self.handle_s2c_notification,
+        }
 
     async def add_device_sub(self, did: str):
         """
@@ -42,9 +57,27 @@ class WebsocketConnection:
         Returns:
             The result of the subscription operation
         """
-        devices = self.subscribed_devices.copy()
-        devices.append(did)
-        return await self.subscribe(devices)
+        return await self.add_device_subs([did])
+
+    async def add_device_subs(self, dids: list[str]):
+        """
+        Asynchronously adds new devices to the list of subscribed devices.
+
+        Only the devices not requested yet are sent, in a single subscription
+        request, as the server adds them to the existing subscriptions.
+
+        Args:
+            dids (list[str]): The IDs of the devices to be added.
+        Returns:
+            The result of the subscription operation
+        """
+        requested = self._requested_subs
+        new_dids = [did for did in dict.fromkeys(dids) if did not in requested]
+        if not new_dids:
+            return None
+        # Marked before sending so overlapping calls do not request them again
+        requested.update(new_dids)
+        return await self.subscribe(new_dids)
 
     async def connect(self) -> ClientWebSocketResponse:
         """
@@ -55,9 +88,11 @@ class WebsocketConnection:
         """
         connection = await self.session.ws_connect(f"{self.url}")
         self.connection = connection
-        # Create a background task to receive messages
-        self.receive_messages_task = asyncio.ensure_future(
-            self.receive_messages(connection)
+        # Create a background task to receive messages, kept so close() can cancel it
+        if self.receive_messages_task is not None:
+            self.receive_messages_task.cancel()
+        self.receive_messages_task = asyncio.get_running_loop().create_task(
+            self.receive_messages(connection), name="gizwits-ws-receive"
         )
         return connection
 
@@ -86,7 +121,11 @@ class WebsocketConnection:
                 },
             }
             await self.send(payload)
-            self.ping_task = asyncio.create_task(self._send_ping_periodically())
+            if self.ping_task is not None:
+                self.ping_task.cancel()
+            self.ping_task = asyncio.get_running_loop().create_task(
+                self._send_ping_periodically(), name="gizwits-ws-ping"
+            )
 
     async def _send_ping(self) -> None:
         """
@@ -95,8 +134,7 @@ class WebsocketConnection:
         Returns:
             None
         """
-        payload = {"cmd": "ping"}
-        await self.send(payload)
+        await self._send_str(_PING_MESSAGE)
 
     async def _send_ping_periodically(self):
         """
@@ -126,8 +164,6 @@ class WebsocketConnection:
         await self.send(payload)
 
     async def receive_messages(self, ws: ClientWebSocketResponse):
-        # sourcery skip: merge-comparisons, merge-duplicate-blocks,
-        # remove-redundant-if
         """
         Asynchronously receives messages from a web socket connection.
 
@@ -137,18 +173,15 @@ class WebsocketConnection:
         Returns:
             None
         """
-        async for message in ws:
-            if message.type == WSMsgType.TEXT:
+        while True:
+            message = await ws.receive()
+            message_type = message.type
+            if message_type is WSMsgType.TEXT:
                 await self.handle_message(message.data)
-            elif message.type == WSMsgType.BINARY:
-                # Handle binary message
-                pass
-            elif message.type == WSMsgType.CLOSED:
-                # Connection closed
-                break
-            elif message.type == WSMsgType.ERROR:
-                # Connection error
+            elif message_type in _TERMINAL_MESSAGE_TYPES:
+                # Connection closed or errored
                 break
+            # Binary messages are not used by the protocol
 
     async def handle_message(self, message: str):
         """
@@ -160,26 +193,23 @@ class WebsocketConnection:
             None.
         """
         try:
-            data = json.loads(message)
+            data = orjson.loads(message)
 
             cmd = data.get('cmd')
             data = data.get('data')
 
             if cmd and data:
                 # Handle the command and data accordingly
-                if cmd == "login_res":
-                    await self.handle_login_response(data)
-                elif cmd == "subscribe_res":
-                    await self.handle_device_subscribe_response(data)
-                elif cmd == "s2c_noti":
-                    await self.handle_s2c_notification(data)
+                handler = self._handlers.get(cmd)
+                if handler is not None:
+                    await handler(data)
                 else:
-                    logger.debug(f"Received unknown command: {cmd}")
+                    logger.debug("Received unknown command: %s", cmd)
             elif cmd == "pong":
                 logger.debug("Received pong")
             else:
-                logger.warn(f"Received invalid message: {message}")
-        except json.JSONDecodeError:
+                logger.warning("Received invalid message: %s", message)
+        except orjson.JSONDecodeError:
             logger.error("Invalid JSON format for the received message.")
 
     async def handle_login_response(self, data: Dict):
@@ -204,16 +234,17 @@ class WebsocketConnection:
         Returns:
             None
         """
-        success_list: list[Any] = cast(list[Any], data.get("success"))
+        success_list: list[Any] = data.get("success") or []
+        devices = self.device_manager.devices
         for success_obj in success_list:
             did = success_obj['did']
-            if did not in self.subscribed_devices:
+            if did not in self._subscribed_set:
                 # Add the unique 'did' to your list
+                self._subscribed_set.add(did)
                 self.subscribed_devices.append(did)
-            device: 'GizwitsDevice' = cast(
-                'GizwitsDevice', self.device_manager.devices.get(did)
-            )
-            device.websocket_connection = self
+            device: Optional['GizwitsDevice'] = devices.get(did)
+            if device is not None:
+                device.websocket_connection = self
 
     async def handle_s2c_notification(self, data: Dict) -> None:
         """
@@ -233,14 +264,18 @@ class WebsocketConnection:
         Returns:
             None
         """
-        if self.ping_task:
+        if self.ping_task is not None:
             self.ping_task.cancel()
-        if self.receive_messages_task:
+            self.ping_task = None
+        if self.receive_messages_task is not None:
             self.receive_messages_task.cancel()
-        if self.connection:
-            await self.connection.close()
+            self.receive_messages_task = None
+        if self.connection is not None:
+            connection = self.connection
+            self.connection = None
+            await connection.close()
         else:
-            logger.warn("Connection already closed.")
+            logger.warning("Connection already closed.")
 
     async def send(self, message: Dict[str, Any]) -> None:
         """
@@ -251,7 +286,18 @@ class WebsocketConnection:
         Returns:
             None
         """
-        if self.connection:
-            await self.connection.send_json(message)
+        await self._send_str(orjson.dumps(message).decode())
+
+    async def _send_str(self, message: str) -> None:
+        """
+        Asynchronously sends an already serialized JSON message over the connection.
+
+        Args:
+            message (str): The serialized JSON message to send.
+        Returns:
+            None
+        """
+        if self.connection is not None:
+            await self.connection.send_str(message)
         else:
             logger.error("Connection closed.")
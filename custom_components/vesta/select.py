@@ -5,7 +5,7 @@ from __future__ import annotations
 from homeassistant.components.select import SelectEntity, SelectEntityDescription
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EntityCategory
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import VestaCoordinator
@@ -21,15 +21,10 @@ async def async_setup_entry(
 ) -> None:
     coordinator: VestaCoordinator = hass.data[DOMAIN][config_entry.entry_id]
 
-    entities: list[VestaEntity] = []
-
-    for device in coordinator.device_manager.devices.values():
-        entities.extend(
-            [
-                VestaTempUnitSelect(coordinator, config_entry, device),
-            ]
-        )
-    async_add_entities(entities)
+    async_add_entities(
+        VestaTempUnitSelect(coordinator, config_entry, device)
+        for device in coordinator.device_manager.devices.values()
+    )
 
 
 class VestaTempUnitSelect(VestaEntity, SelectEntity):
@@ -47,16 +42,14 @@ class VestaTempUnitSelect(VestaEntity, SelectEntity):
             entity_category=EntityCategory.CONFIG,
         ))
 
-    @property
-    def current_option(self) -> str | None:
-        if not self.status:
-            return None
-        t = self.device.attributes.get("temp_unit")
-        if t is None:
-            return None
-        return self.options[t]
+    @callback
+    def _async_update_attrs(self) -> None:
+        super()._async_update_attrs()
+        t = self.device.attributes.get("temp_unit") if self.status else None
+        self._attr_current_option = None if t is None else self.options[t]
 
     async def async_select_option(self, option: str) -> None:
         """Change the selected option."""
-        await self.device.set_device_attribute("temp_unit", self.options.index(option))
-        await self.coordinator.async_refresh()
+        attributes = {"temp_unit": self.options.index(option)}
+        if await self.async_set_device_attributes(attributes):
+            self._async_apply_optimistic(attributes)
@@ -5,7 +5,7 @@ from __future__ import annotations
 from homeassistant.components.sensor import SensorEntity, SensorDeviceClass, SensorEntityDescription
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import UnitOfTime
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import VestaCoordinator
@@ -13,6 +13,12 @@ from .const import DOMAIN
 from .entity import VestaEntity
 from .pygizwits import GizwitsDevice
 
+# The device protocol spells these keys with three n's
+_RUNNING_TIME_HOUR = "runnning_time_hour"
+_RUNNING_TIME_MIN = "runnning_time_min"
+_REMAINING_TIME_HOUR = "remaining_time_hour"
+_REMAINING_TIME_MIN = "remaining_time_min"
+
 
 async def async_setup_entry(
         hass: HomeAssistant,
@@ -21,21 +27,49 @@ async def async_setup_entry(
 ) -> None:
     coordinator: VestaCoordinator = hass.data[DOMAIN][config_entry.entry_id]
 
-    entities: list[VestaEntity] = []
+    async_add_entities(
+        entity_type(coordinator, config_entry, device)
+        for device in coordinator.device_manager.devices.values()
+        for entity_type in (VestaRunningTime, VestaRemainingTime)
+    )
 
-    for device in coordinator.device_manager.devices.values():
-        entities.extend(
-            [
-                VestaRunningTime(coordinator, config_entry, device),
-                VestaRemainingTime(coordinator, config_entry, device),
-            ]
-        )
-    async_add_entities(entities)
 
+class VestaDurationSensor(VestaEntity, SensorEntity):
+    """Sensor combining an hour and a minute attribute into a duration."""
 
-class VestaRunningTime(VestaEntity, SensorEntity):
     _attr_device_class = SensorDeviceClass.DURATION
     _attr_native_unit_of_measurement = UnitOfTime.MINUTES
+    _hour_key: str
+    _minute_key: str
+    _duration: tuple[int, int] | None = None
+
+    @callback
+    def _async_update_attrs(self) -> None:
+        super()._async_update_attrs()
+        attributes = self.device.attributes
+        hour = attributes.get(self._hour_key)
+        minute = attributes.get(self._minute_key)
+        if not self.status or hour is None or minute is None:
+            self._duration = None
+            self._attr_native_value = None
+            self._attr_extra_state_attributes = None
+            return
+
+        # Keep the same attributes dict while the duration does not change
+        duration = (hour, minute)
+        if duration == self._duration:
+            return
+        self._duration = duration
+        self._attr_native_value = hour * 60 + minute
+        self._attr_extra_state_attributes = {
+            self._hour_key: hour,
+            self._minute_key: minute
+        }
+
+
+class VestaRunningTime(VestaDurationSensor):
+    _hour_key = _RUNNING_TIME_HOUR
+    _minute_key = _RUNNING_TIME_MIN
 
     def __init__(
             self,
@@ -49,26 +83,10 @@ class VestaRunningTime(VestaEntity, SensorEntity):
             icon="mdi:timeline-clock-outline"
         ))
 
-    @property
-    def native_value(self) -> float | None:
-        if not self.status:
-            return None
-        return self.device.attributes["runnning_time_hour"] * 60 + self.device.attributes["runnning_time_min"]
-
-    @property
-    def extra_state_attributes(self) -> dict[str, int] | None:
-        if not self.status:
-            return None
-
-        return {
-            "runnning_time_hour": self.device.attributes["runnning_time_hour"],
-            "runnning_time_min": self.device.attributes["runnning_time_min"]
-        }
-
 
-class VestaRemainingTime(VestaEntity, SensorEntity):
-    _attr_device_class = SensorDeviceClass.DURATION
-    _attr_native_unit_of_measurement = UnitOfTime.MINUTES
+class VestaRemainingTime(VestaDurationSensor):
+    _hour_key = _REMAINING_TIME_HOUR
+    _minute_key = _REMAINING_TIME_MIN
 
     def __init__(
             self,
@@ -81,19 +99,3 @@ class VestaRemainingTime(VestaEntity, SensorEntity):
             name="Remaining time",
             icon="mdi:progress-clock"
         ))
-
-    @property
-    def native_value(self) -> float | None:
-        if not self.status:
-            return None
-        return self.device.attributes["remaining_time_hour"] * 60 + self.device.attributes["remaining_time_min"]
-
-    @property
-    def extra_state_attributes(self) -> dict[str, int] | None:
-        if not self.status:
-            return None
-
-        return {
-            "remaining_time_hour": self.device.attributes["remaining_time_hour"],
-            "remaining_time_min": self.device.attributes["remaining_time_min"]
-        }
@@ -4,7 +4,7 @@ from datetime import time
 
 from homeassistant.components.time import TimeEntity, TimeEntityDescription
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import VestaCoordinator
@@ -12,6 +12,9 @@ from .const import DOMAIN
 from .entity import VestaEntity
 from .pygizwits import GizwitsDevice
 
+_SET_TIME_HOUR = "set_time_hour"
+_SET_TIME_MIN = "set_time_min"
+
 
 async def async_setup_entry(
         hass: HomeAssistant,
@@ -20,15 +23,10 @@ async def async_setup_entry(
 ) -> None:
     coordinator: VestaCoordinator = hass.data[DOMAIN][config_entry.entry_id]
 
-    entities: list[VestaEntity] = []
-
-    for device in coordinator.device_manager.devices.values():
-        entities.extend(
-            [
-                VestaTimer(coordinator, config_entry, device),
-            ]
-        )
-    async_add_entities(entities)
+    async_add_entities(
+        VestaTimer(coordinator, config_entry, device)
+        for device in coordinator.device_manager.devices.values()
+    )
 
 
 class VestaTimer(VestaEntity, TimeEntity):
@@ -44,16 +42,22 @@ class VestaTimer(VestaEntity, TimeEntity):
             icon="mdi:timer-edit-outline",
         ))
 
-    @property
-    def native_value(self) -> time | None:
-        if not self.status:
-            return None
-        return time(hour=self.device.attributes["set_time_hour"], minute=self.device.attributes["set_time_min"])
+    @callback
+    def _async_update_attrs(self) -> None:
+        super()._async_update_attrs()
+        attributes = self.device.attributes
+        hour = attributes.get(_SET_TIME_HOUR)
+        minute = attributes.get(_SET_TIME_MIN)
+        if not self.status or hour is None or minute is None:
+            self._attr_native_value = None
+            return
+        self._attr_native_value = time(hour=hour, minute=minute)
 
     async def async_set_value(self, value: time) -> None:
         if value is None:
             return
         hour = value.hour
         minute = value.minute
-        await self.device.set_device_attributes({"set_time_hour": hour, "set_time_min": minute})
-        await self.coordinator.async_refresh()
+        attributes = {_SET_TIME_HOUR: hour, _SET_TIME_MIN: minute}
+        if await self.async_set_device_attributes(attributes):
+            self._async_apply_optimistic(attributes)
@@ -0,0 +1,37 @@
+"""Test the Vesta coordinator."""
+
+from datetime import timedelta
+from unittest.mock import MagicMock
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.vesta.coordinator import VestaCoordinator
+
+
+async def test_status_update_burst_is_debounced(hass: HomeAssistant):
+    """Test a burst of pushes causes one immediate and one trailing update."""
+    coordinator = VestaCoordinator(hass, MagicMock())
+    updates: list[None] = []
+    coordinator.async_add_listener(lambda: updates.append(None))
+    device = MagicMock(device_id="a", is_online=True, attributes={"onoff": False})
+
+    for onoff in (True, False, True, False, True):
+        device.attributes = {"onoff": onoff}
+        coordinator.status_update(device)
+    await hass.async_block_till_done()
+    assert len(updates) == 1
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+    await hass.async_block_till_done()
+    assert len(updates) == 2
+    # The trailing update carries the last pushed state
+    assert coordinator.states["a"].onoff is True
+
+    # Nothing more is sent once the burst has been flushed
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=2))
+    await hass.async_block_till_done()
+    assert len(updates) == 2
+
+    await coordinator.async_shutdown()
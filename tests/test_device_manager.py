@@ -0,0 +1,47 @@
+"""Test the Gizwits device manager."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from custom_components.vesta.pygizwits import (
+    DeviceManager,
+    GizwitsDevice,
+    WebsocketConnection,
+)
+
+
+def _device(manager: DeviceManager, device_id: str) -> GizwitsDevice:
+    """Create a device bound to the manager."""
+    return GizwitsDevice(
+        device_id,
+        "Cooker",
+        "Vesta",
+        "00:11:22:33:44:55",
+        8080,
+        "m2m.example.com",
+        8880,
+        "4.0",
+        "1",
+        "1",
+        "1",
+        True,
+        manager.client,
+        manager,
+    )
+
+
+async def test_overlapping_subscriptions_subscribe_once():
+    """Test overlapping subscriptions only request a device once."""
+    manager = DeviceManager(MagicMock(), "app_id")
+    device = _device(manager, "a")
+
+    with patch.object(WebsocketConnection, "connect", AsyncMock()), patch.object(
+        WebsocketConnection, "login", AsyncMock()
+    ), patch.object(WebsocketConnection, "subscribe", AsyncMock()) as subscribe:
+        await asyncio.gather(
+            manager.subscribe_to_devices([device]),
+            manager.subscribe_to_devices([device]),
+        )
+
+    subscribe.assert_awaited_once_with(["a"])
+    assert len(manager.sockets) == 1
@@ -0,0 +1,185 @@
+"""Test the Gizwits client."""
+
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from custom_components.vesta.pygizwits import DeviceManager, GizwitsException
+from custom_components.vesta.pygizwits.gizwits_client import GizwitsUserToken
+
+
+def _binding(device_id: str) -> dict[str, Any]:
+    """Create a binding as returned by the API."""
+    return {
+        "did": device_id,
+        "dev_alias": f"Cooker {device_id}",
+        "product_name": "Vesta",
+        "mac": "00:11:22:33:44:55",
+        "ws_port": 8080,
+        "host": "m2m.example.com",
+        "wss_port": 8880,
+        "protoc": "4.0",
+        "mcu_soft_version": "1",
+        "mcu_hard_version": "1",
+        "wifi_soft_version": "1",
+        "is_online": True,
+    }
+
+
+@pytest.mark.parametrize(
+    "count",
+    [0, 5, 20, 40, 45, 100, 101],
+    ids=[
+        "empty",
+        "single_page",
+        "one_full_page",
+        "exact_multiple",
+        "short_last_page",
+        "exact_prefetch_batch",
+        "past_prefetch_batch",
+    ],
+)
+async def test_get_bindings_pages(count: int):
+    """Test every binding is retrieved whatever the number of pages."""
+    manager = DeviceManager(MagicMock(), "app_id")
+    bindings = [_binding(f"did{index}") for index in range(count)]
+    requested: list[int] = []
+
+    async def get(endpoint: str) -> dict[str, Any]:
+        query = parse_qs(urlsplit(endpoint).query)
+        limit, skip = int(query["limit"][0]), int(query["skip"][0])
+        requested.append(skip)
+        return {"devices": bindings[skip:skip + limit]}
+
+    manager.client._get = get  # type: ignore[method-assign]
+    devices = await manager.client.get_bindings(manager)
+
+    assert list(devices) == [binding["did"] for binding in bindings]
+    assert manager.devices == devices
+    # The pages are only requested once each
+    assert len(requested) == len(set(requested))
+
+
+def _manager_with_devices(*device_ids: str) -> DeviceManager:
+    """Create a device manager with the given devices bound."""
+    manager = DeviceManager(MagicMock(), "app_id")
+    manager.devices = {device_id: MagicMock() for device_id in device_ids}
+    return manager
+
+
+async def test_set_device_attributes_merges_writes():
+    """Test writes to a device in quick succession are sent in one request."""
+    manager = _manager_with_devices("a", "b")
+    client = manager.client
+    client._post = AsyncMock()  # type: ignore[method-assign]
+
+    await asyncio.gather(
+        client.set_device_attributes("a", {"onoff": True}),
+        client.set_device_attribute("a", "temp_unit", 1),
+        client.set_device_attributes("b", {"onoff": False}),
+    )
+
+    assert sorted(call.args for call in client._post.await_args_list) == [
+        ("/app/control/a", {"attrs": {"onoff": True, "temp_unit": 1}}),
+        ("/app/control/b", {"attrs": {"onoff": False}}),
+    ]
+
+
+async def test_set_device_attributes_error_fan_out():
+    """Test every caller of a failed request gets its own exception."""
+    manager = _manager_with_devices("a")
+    client = manager.client
+    cause = RuntimeError("boom")
+    client._post = AsyncMock(side_effect=cause)  # type: ignore[method-assign]
+
+    results = await asyncio.gather(
+        client.set_device_attributes("a", {"onoff": True}),
+        client.set_device_attributes("a", {"temp_unit": 1}),
+        return_exceptions=True,
+    )
+
+    assert client._post.await_count == 1
+    assert all(isinstance(result, GizwitsException) for result in results)
+    assert results[0] is not results[1]
+    assert all(result.__cause__ is cause for result in results)
+
+
+async def test_close_fails_pending_writes():
+    """Test closing the client fails the writes not sent yet."""
+    manager = _manager_with_devices("a")
+    client = manager.client
+    client._post = AsyncMock()  # type: ignore[method-assign]
+
+    write = asyncio.ensure_future(client.set_device_attributes("a", {"onoff": True}))
+    await asyncio.sleep(0)
+    client.close()
+
+    with pytest.raises(GizwitsException):
+        await write
+    # The scheduled flush was cancelled with the client
+    await asyncio.sleep(0.05)
+    client._post.assert_not_awaited()
+
+
+async def test_close_fails_writes_in_flight():
+    """Test closing the client fails the writes being sent."""
+    manager = _manager_with_devices("a")
+    client = manager.client
+    sent = asyncio.Event()
+
+    async def post(endpoint: str, data: dict[str, Any]) -> dict[str, Any]:
+        sent.set()
+        await asyncio.Event().wait()
+        return {}
+
+    client._post = post  # type: ignore[method-assign]
+
+    write = asyncio.ensure_future(client.set_device_attributes("a", {"onoff": True}))
+    await sent.wait()
+    client.close()
+
+    with pytest.raises(GizwitsException):
+        await write
+
+
+async def test_get_token_shares_concurrent_logins():
+    """Test concurrent logins with the same credentials make one request."""
+    client = DeviceManager(MagicMock(), "app_id").client
+    requested: list[tuple[str, str]] = []
+
+    async def request_token(username: str, password: str) -> GizwitsUserToken:
+        requested.append((username, password))
+        await asyncio.sleep(0)
+        return GizwitsUserToken(username, f"token-{username}", 0)
+
+    client._request_token = request_token  # type: ignore[method-assign]
+
+    first, second, other = await asyncio.gather(
+        client.get_token("user", "password"),
+        client.get_token("user", "password"),
+        client.get_token("other", "password"),
+    )
+
+    assert requested == [("user", "password"), ("other", "password")]
+    assert first is second
+    assert other.user_token == "token-other"
+    assert not client._token_tasks
+
+
+async def test_get_token_retries_after_failure():
+    """Test a failed login is not reused by the next one."""
+    client = DeviceManager(MagicMock(), "app_id").client
+    client._request_token = AsyncMock(  # type: ignore[method-assign]
+        side_effect=[GizwitsException(), GizwitsUserToken("user", "token", 0)]
+    )
+
+    with pytest.raises(GizwitsException):
+        await client.get_token("user", "password")
+    assert not client._token_tasks
+
+    token = await client.get_token("user", "password")
+    assert token.user_token == "token"
+    assert client._request_token.await_count == 2
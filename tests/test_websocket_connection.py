@@ -0,0 +1,30 @@
+"""Test the Gizwits websocket connection."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+from custom_components.vesta.pygizwits import DeviceManager, WebsocketConnection
+
+
+async def test_close_cancels_background_tasks():
+    """Test closing the connection cancels the receive and ping tasks."""
+    ws = AsyncMock()
+    ws.receive.side_effect = asyncio.Event().wait
+    session = MagicMock()
+    session.ws_connect = AsyncMock(return_value=ws)
+    connection = WebsocketConnection(
+        session,
+        DeviceManager(session, "app_id"),
+        {"pre": "wss://", "host": "m2m.example.com", "port": "8880", "path": "/ws/app/v1"},
+    )
+
+    await connection.connect()
+    await connection.login()
+    tasks = [connection.receive_messages_task, connection.ping_task]
+    await connection.close()
+    await asyncio.sleep(0)
+
+    assert all(task is not None and task.cancelled() for task in tasks)
+    assert connection.receive_messages_task is None
+    assert connection.ping_task is None
+    ws.close.assert_awaited_once()